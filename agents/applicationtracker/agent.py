@@ -1,17 +1,11 @@
 from google.adk.agents.llm_agent import Agent
-from google.adk.models.lite_llm import LiteLlm
-from tools.fs import JobHuntToolset
+from tools.fs import get_toolset
+from tools.llm_cache import CachedLiteLlm, prompt_cache_key
 
 description = """Creates a standardized CSV row tracking job application status and artifact references (tailored resume and cover letter). Ensures consistent schema and deterministic job_id usage."""
 instruction = """
 You generate a single CSV entry for a job application using structured job data and artifact references.
 
-Inputs:
-- job_intel_json (must include job_id)
-- resume_ref (path or artifact id)
-- cover_letter_ref (path or artifact id)
-- optional application_meta: date_applied (YYYY-MM-DD), status, notes
-
 Defaults:
 - status = "Applied" if date_applied exists, else "Not Applied".
 - Leave unknown fields blank; do not guess.
@@ -24,12 +18,21 @@ Rules:
 - keywords must be semicolon-separated (no commas).
 - Escape quotes properly.
 - No extra commentary outside CSV.
+
+Inputs:
+- job_intel_json (must include job_id)
+- resume_ref (path or artifact id)
+- cover_letter_ref (path or artifact id)
+- optional application_meta: date_applied (YYYY-MM-DD), status, notes
 """
 
 root_agent = Agent(
-    model=LiteLlm(model="openai/gpt-5-nano"),
+    model=CachedLiteLlm(
+        model="openai/gpt-5-nano",
+        extra_body={"prompt_cache_key": prompt_cache_key(instruction)},
+    ),
     name="application_tracker",
     description=description,
     instruction=instruction,
-    tools=[JobHuntToolset()],
+    tools=[get_toolset()],
 )
@@ -1,17 +1,12 @@
 from google.adk.agents.llm_agent import Agent
-from google.adk.models.lite_llm import LiteLlm
-from tools.fs import JobHuntToolset
+from tools.fs import get_toolset
+from tools.llm_cache import CachedLiteLlm, prompt_cache_key
 
 description = """
 Generates a job-specific cover letter aligned with German hiring norms using structured job intelligence and verified resume facts."""
 
 instruction = """You generate a professional cover letter based strictly on verified resume facts and structured job intelligence.
 
-Inputs:
-- job_intel_json
-- resume_verified_facts (ONLY facts extracted from the resume; no guessing)
-- optional preferences: language (de/en), tone (formal/neutral), length (short/standard), include_salary_expectation (true/false)
-
 Rules:
 - Do NOT invent achievements, metrics, employers, or projects.
 - Use only facts present in resume_verified_facts.
@@ -32,12 +27,20 @@ Output schema (JSON only):
 }
 
 If critical info is missing to write responsibly (e.g., availability, work authorization), add to missing_information without inventing.
+
+Inputs:
+- job_intel_json
+- resume_verified_facts (ONLY facts extracted from the resume; no guessing)
+- optional preferences: language (de/en), tone (formal/neutral), length (short/standard), include_salary_expectation (true/false)
 """
 
 root_agent = Agent(
-    model=LiteLlm(model="openai/gpt-5-nano"),
+    model=CachedLiteLlm(
+        model="openai/gpt-5-nano",
+        extra_body={"prompt_cache_key": prompt_cache_key(instruction)},
+    ),
     name="cover_letter_agent",
     description=description,
     instruction=instruction,
-    tools=[JobHuntToolset()],
+    tools=[get_toolset()],
 )
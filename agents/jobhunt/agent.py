@@ -1,23 +1,31 @@
+import asyncio
+import re
+from pathlib import Path
+from typing import Any, Dict, Optional
+
 from applicationtracker.agent import root_agent as applicationt_racker_agent
 from coverletter.agent import root_agent as cover_letter_agent
+from google.adk.agents.callback_context import CallbackContext
 from google.adk.agents.llm_agent import Agent
-from google.adk.models.lite_llm import LiteLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
 from google.adk.tools.agent_tool import AgentTool
+from google.adk.tools.function_tool import FunctionTool
+from google.adk.tools.tool_context import ToolContext
+from google.genai import types
 from jobintel.agent import root_agent as job_intel_agent
 from resumeanalyser.agent import root_agent as resume_analyser_agent
+from resumefacts.agent import root_agent as resume_facts_agent
 from scoreragent.agent import root_agent as scorer_agent
-from tools.fs import JobHuntToolset
+from tools import json_fast
+from tools.fs import fs_save_artifact, get_toolset
+from tools.llm_cache import CachedLiteLlm, prompt_cache_key
 
 description = """Orchestrates the end-to-end workflow: job parsing, resume tailoring, cover letter generation, and application tracking. Enforces validation and prevents hallucination across agents. Optionally triggers scoring/versioning steps if available."""
 
 instruction = """
 You manage the job application pipeline deterministically. You do not do sub-agents’ work; you coordinate and validate.
 
-Inputs:
-- job_url or raw_jd_text
-- base_resume_path (optional at first; must be collected before resume tailoring)
-- optional user prefs (language, tone, max_pages, etc.)
-
 Input collection rules (MANDATORY):
 1) If base_resume_path is missing/empty:
    - Do NOT run the pipeline.
@@ -43,11 +51,13 @@ Pipeline (only after required inputs exist):
    - If weak, re-run Job Intel with stricter extraction instructions.
 3) Call Resume Tailor Agent with base_resume_path + job_intel_json.
 4) Reject/redo if Resume Tailor risk_flags indicate fabrication or if ats_keyword_coverage.matched_keywords is empty.
-5) Call Resume Analyser Agent to extract resume_verified_facts from the updated resume (facts only).
-6) Call Cover Letter Agent with job_intel_json + resume_verified_facts + prefs.
-7) Call Scorer Agent to compute hashes/coverage metrics if available.
-8) Call Application Tracker Agent to generate CSV row referencing produced artifacts.
-9) Return consolidated bundle.
+5) Call run_downstream_pipeline once with job_intel_json, base_resume_path, updated_resume_path and prefs.
+   It runs the remaining steps with independent agents in parallel:
+   - Resume Facts Agent (extract resume_verified_facts from the updated resume) and Scorer (hashes/coverage metrics) run concurrently.
+   - Cover Letter Agent then runs with job_intel_json + resume_verified_facts + prefs; the letter is saved next to the tailored resume.
+   - Application Tracker Agent then generates the CSV row referencing the saved resume and cover letter paths.
+   If a step's output is unusable, re-run only that sub-agent directly.
+6) Return consolidated bundle.
 
 Anti-hallucination:
 - If any agent introduces unverifiable claims, stop and re-run that agent with explicit constraints.
@@ -60,19 +70,187 @@ Final output MUST be JSON only:
   "cover_letter": "",
   "application_tracker_csv": ""
 }
+
+Inputs:
+- job_url or raw_jd_text
+- base_resume_path (optional at first; must be collected before resume tailoring)
+- optional user prefs (language, tone, max_pages, etc.)
+
+Inputs set by the caller in session state (empty when not set; prefer them over chat text):
+- base_resume_path: {base_resume_path?}
+- job_url: {job_url?}
+- raw_jd_text: {raw_jd_text?}
 """
 
+job_intel_tool = AgentTool(job_intel_agent)
+application_tracker_tool = AgentTool(applicationt_racker_agent)
+cover_letter_tool = AgentTool(cover_letter_agent)
+resume_analyser_tool = AgentTool(resume_analyser_agent)
+resume_facts_tool = AgentTool(resume_facts_agent)
+scorer_tool = AgentTool(scorer_agent)
+
+_UNSAFE_FILENAME_RE = re.compile(r"[^A-Za-z0-9_-]+")
+
+
+def _field(payload: Any, key: str) -> Any:
+    """Read a top-level key from an agent's JSON output (dict or JSON text)."""
+    if isinstance(payload, str):
+        try:
+            payload = json_fast.loads(payload)
+        except ValueError:
+            return None
+    return payload.get(key) if isinstance(payload, dict) else None
+
+
+async def run_downstream_pipeline(
+    job_intel_json: str,
+    base_resume_path: str,
+    updated_resume_path: str,
+    prefs: str,
+    tool_context: ToolContext,
+) -> Dict[str, Any]:
+    """
+    Run the post-tailoring steps, fanning out independent sub-agents.
+
+    Resume fact extraction and scoring only depend on the tailored resume, so they
+    run concurrently; the cover letter waits for the facts and the tracker row
+    waits for the saved cover letter.
+
+    Args:
+        job_intel_json: Job Intel output (JSON text).
+        base_resume_path: Path of the untouched base resume.
+        updated_resume_path: Path of the tailored resume.
+        prefs: Optional user preferences (JSON text, may be empty).
+        tool_context: ADK tool context.
+    Returns:
+        {'status': 'success', 'resume_verified_facts': ..., 'metrics': ...,
+         'cover_letter': ..., 'cover_letter_path': ..., 'application_tracker_csv': ...}
+        or {'status': 'error', 'error_message': '...'}
+    """
+    try:
+        facts, metrics = await asyncio.gather(
+            resume_facts_tool.run_async(
+                args={"request": f"resume_path: {updated_resume_path}"},
+                tool_context=tool_context,
+            ),
+            scorer_tool.run_async(
+                args={
+                    "request": (
+                        f"job_intel_json: {job_intel_json}\n"
+                        f"resume_base_path: {base_resume_path}\n"
+                        f"resume_tailored_path: {updated_resume_path}"
+                    )
+                },
+                tool_context=tool_context,
+            ),
+        )
+        cover = await cover_letter_tool.run_async(
+            args={
+                "request": (
+                    f"job_intel_json: {job_intel_json}\n"
+                    f"resume_verified_facts: {facts}\n"
+                    f"preferences: {prefs}"
+                )
+            },
+            tool_context=tool_context,
+        )
+
+        # The tracker needs an artifact reference, not the letter itself.
+        cover_letter = _field(cover, "cover_letter") or str(cover)
+        # job_id is model output; strip anything that could leave the folder.
+        raw_job_id = str(_field(job_intel_json, "job_id") or "")
+        job_id = _UNSAFE_FILENAME_RE.sub("", raw_job_id) or "job"
+        saved = fs_save_artifact(
+            str(Path(updated_resume_path).parent),
+            f"cover_letter_{job_id}.txt",
+            cover_letter,
+            overwrite=True,
+        )
+        if saved["status"] != "success":
+            return saved
+
+        tracker_csv = await application_tracker_tool.run_async(
+            args={
+                "request": (
+                    f"job_intel_json: {job_intel_json}\n"
+                    f"resume_ref: {updated_resume_path}\n"
+                    f"cover_letter_ref: {saved['path']}"
+                )
+            },
+            tool_context=tool_context,
+        )
+        return {
+            "status": "success",
+            "resume_verified_facts": facts,
+            "metrics": metrics,
+            "cover_letter": cover_letter,
+            "cover_letter_path": saved["path"],
+            "application_tracker_csv": tracker_csv,
+        }
+    except Exception as e:
+        return {"status": "error", "error_message": str(e)}
+
+
+# Session-state keys a caller can set instead of typing the inputs, e.g.
+# Runner.run_async(state_delta={...}) or the `state_delta` field of the /run body.
+_INPUT_KEYS = ("base_resume_path", "job_url", "raw_jd_text")
+
+# Rules 1 and 2 of the instruction.
+_MISSING_RESUME = {
+    "status": "waiting_for_input",
+    "missing_fields": ["base_resume_path"],
+    "message": "Please provide the file path to your base LaTeX resume (e.g., ./resume.tex).",
+}
+_MISSING_JOB = {
+    "status": "waiting_for_input",
+    "missing_fields": ["job_url_or_raw_jd_text"],
+    "message": "Please provide a job URL or paste the job description text.",
+}
+
+
+def _preflight(
+    callback_context: CallbackContext, llm_request: LlmRequest
+) -> Optional[LlmResponse]:
+    """
+    Apply the input-collection rules without a model call for state-driven runs.
+
+    Setting any of _INPUT_KEYS in session state opts the session into
+    state-driven inputs, so a missing one is a plain lookup. Sessions without
+    those keys pass their inputs as chat text and the instruction decides.
+    """
+    state = callback_context.state
+    if not any(key in state for key in _INPUT_KEYS):
+        return None
+    if not state.get("base_resume_path"):
+        payload = _MISSING_RESUME
+    elif not (state.get("job_url") or state.get("raw_jd_text")):
+        payload = _MISSING_JOB
+    else:
+        return None
+    return LlmResponse(
+        content=types.Content(
+            role="model", parts=[types.Part(text=json_fast.dumps(payload))]
+        )
+    )
+
+
 root_agent = Agent(
-    model=LiteLlm(model="openai/gpt-5-nano"),
+    model=CachedLiteLlm(
+        model="openai/gpt-5-nano",
+        extra_body={"prompt_cache_key": prompt_cache_key(instruction)},
+    ),
     name="controller_agent",
     description=description,
     instruction=instruction,
+    before_model_callback=_preflight,
     tools=[
-        JobHuntToolset(),
-        AgentTool(job_intel_agent),
-        AgentTool(applicationt_racker_agent),
-        AgentTool(cover_letter_agent),
-        AgentTool(resume_analyser_agent),
-        AgentTool(scorer_agent),
+        get_toolset(),
+        FunctionTool(func=run_downstream_pipeline),
+        job_intel_tool,
+        application_tracker_tool,
+        cover_letter_tool,
+        resume_analyser_tool,
+        resume_facts_tool,
+        scorer_tool,
     ],
 )
@@ -1,7 +1,7 @@
 from google.adk.agents.llm_agent import Agent
-from google.adk.models.lite_llm import LiteLlm
 from tools.fetch import WebToolset
-from tools.fs import JobHuntToolset
+from tools.fs import get_toolset
+from tools.llm_cache import CachedLiteLlm, prompt_cache_key
 
 description = """
 Parses a job posting (URL or raw text), extracts structured information,
@@ -11,10 +11,6 @@ classifies requirements (must vs nice), and produces ATS-relevant intelligence i
 instruction = """
 You are responsible for converting a job posting into structured, actionable intelligence.
 
-Inputs:
-	•	job_url OR raw_jd_text
-	•	optional: company_name, role_title, location
-
 Execution rules:
 	•	If job_url is provided, fetch and extract only the job description content.
 	•	If raw_jd_text is provided, do not fetch.
@@ -53,15 +49,22 @@ Output schema:
     },
     "red_flags": []
   }
+
+Inputs:
+	•	job_url OR raw_jd_text
+	•	optional: company_name, role_title, location
 """
 
 root_agent = Agent(
-    model=LiteLlm(model="openai/gpt-5-nano"),
+    model=CachedLiteLlm(
+        model="openai/gpt-5-nano",
+        extra_body={"prompt_cache_key": prompt_cache_key(instruction)},
+    ),
     name="job_intel_agent",
     description=description,
     instruction=instruction,
     tools=[
         WebToolset(),
-        JobHuntToolset(),
+        get_toolset(),
     ],
 )
@@ -1,6 +1,6 @@
 from google.adk.agents.llm_agent import Agent
-from google.adk.models.lite_llm import LiteLlm
-from tools.fs import JobHuntToolset
+from tools.fs import get_toolset
+from tools.llm_cache import CachedLiteLlm, prompt_cache_key
 
 description = """
 Takes a file path to a base LaTeX resume, tailors it to
@@ -13,11 +13,6 @@ and artifact metadata.
 instruction = """
 You tailor a LaTeX resume for a specific job and manage output artifacts.
 
-Inputs:
-    • base_resume_path (absolute or relative file path)
-    • job_intel_json
-    • optional constraints: max_pages, language_lock, no_new_roles
-
 Input validation (MANDATORY):
 
 1. If base_resume_path is missing, empty, or not provided:
@@ -30,7 +25,7 @@ Input validation (MANDATORY):
      }
 
 2. If base_resume_path is provided:
-   - Call jobhunt_read_text(base_resume_path).
+   - Call jobhubt_fs_read_text(base_resume_path).
    - If tool returns error:
      Return:
      {
@@ -40,7 +35,7 @@ Input validation (MANDATORY):
    - Only proceed if tool returns status=success.
 
 Operational responsibilities:
-    1. Use the file content returned by jobhunt_read_text.
+    1. Use the file content returned by jobhubt_fs_read_text.
     2. Tailor the resume based strictly on job_intel_json.
     3. Do NOT invent roles, metrics, skills, or certifications.
     4. Every change must align with must_have or keywords_for_ats.
@@ -51,13 +46,11 @@ Artifact management:
        <job_id>_<sanitized_job_title>
        - job_id must come from job_intel_json
        - sanitize title: lowercase, replace spaces with _, remove special characters
-    7. Call jobhunt_mkdir(folder_name).
-    8. Save updated resume as:
-       folder_name/resume_<job_id>_<position>.tex
-       using jobhunt_write_text.
-    9. Do NOT overwrite base resume.
-    10. Compute hash using jobhunt_sha256.
-    11. Return full updated LaTeX content regardless of file saving.
+    7. Save updated resume with a single call:
+       jobhubt_fs_save_artifact(folder_name, "resume_<job_id>_<position>.tex", <updated LaTeX>)
+       It creates the folder, writes the file and returns its sha256.
+    8. Do NOT overwrite base resume.
+    9. Return full updated LaTeX content regardless of file saving.
 
 Output MUST be valid JSON only:
 {
@@ -85,11 +78,19 @@ Error format:
   "error": "Description of failure",
   "details": ""
 }
+
+Inputs:
+    • base_resume_path (absolute or relative file path)
+    • job_intel_json
+    • optional constraints: max_pages, language_lock, no_new_roles
 """
 root_agent = Agent(
-    model=LiteLlm(model="openai/gpt-5-nano"),
+    model=CachedLiteLlm(
+        model="openai/gpt-5-nano",
+        extra_body={"prompt_cache_key": prompt_cache_key(instruction)},
+    ),
     name="resume_tailor_agent",
     description=description,
     instruction=instruction,
-    tools=[JobHuntToolset()],
+    tools=[get_toolset()],
 )
@@ -0,0 +1,43 @@
+from google.adk.agents.llm_agent import Agent
+from tools.fs import get_toolset
+from tools.llm_cache import CachedLiteLlm, prompt_cache_key
+
+description = """Reads a (tailored) LaTeX resume and extracts verifiable facts only — roles, employers, dates, skills, projects, metrics, education — as structured JSON for downstream cover letter generation. Never tailors or writes files."""
+
+instruction = """
+You extract verified facts from a resume. You do not tailor, rewrite or save anything.
+
+Rules:
+- Call jobhubt_fs_read_text(resume_path) and use only the returned content.
+- If the tool returns status=error, return {"error": "Unable to read resume file", "details": "<error_message>"}.
+- Extract only facts stated explicitly in the resume; strip LaTeX markup.
+- Do NOT infer, generalize or invent skills, metrics, employers or dates.
+- Keep each fact short and self-contained (one claim per entry).
+- Output MUST be valid JSON only.
+
+Output schema (JSON only):
+{
+  "resume_verified_facts": {
+    "roles": [{"title": "", "employer": "", "dates": "", "highlights": []}],
+    "skills": [],
+    "projects": [{"name": "", "facts": []}],
+    "education": [],
+    "certifications": [],
+    "languages": []
+  }
+}
+
+Inputs:
+- resume_path (path to the resume to read)
+"""
+
+root_agent = Agent(
+    model=CachedLiteLlm(
+        model="openai/gpt-5-nano",
+        extra_body={"prompt_cache_key": prompt_cache_key(instruction)},
+    ),
+    name="resume_facts_agent",
+    description=description,
+    instruction=instruction,
+    tools=[get_toolset()],
+)
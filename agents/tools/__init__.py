@@ -1 +1 @@
-from . import fetch, fs
+from . import fetch, fs, json_fast, llm_cache, llm_pool
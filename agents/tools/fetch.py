@@ -1,49 +1,119 @@
 import asyncio
+import gzip
+import hashlib
+import os
+import time
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import requests
+import httpx
+import trafilatura
 from google.adk.agents.readonly_context import ReadonlyContext
 from google.adk.tools.base_tool import BaseTool
 from google.adk.tools.base_toolset import BaseToolset
 from google.adk.tools.function_tool import FunctionTool
 
+# ---------------------------
+# Response cache
+# ---------------------------
 
-def web_fetch_html(url: str) -> Dict[str, Any]:
-    """
-    Fetch raw HTML content of a webpage.
-    """
+_FETCH_CACHE_DIR = Path("~/.cache/jobhunt/fetch").expanduser()
+_FETCH_TTL_SECONDS = int(os.environ.get("JOBHUNT_FETCH_TTL", str(24 * 60 * 60)))
+
+
+def _cache_path(url: str) -> Path:
+    return _FETCH_CACHE_DIR / f"{hashlib.sha256(url.encode()).hexdigest()}.html.gz"
+
+
+def _cache_get(url: str) -> Optional[str]:
+    p = _cache_path(url)
+    try:
+        if time.time() - p.stat().st_mtime > _FETCH_TTL_SECONDS:
+            p.unlink(missing_ok=True)
+            return None
+        with gzip.open(p, "rt", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _cache_put(url: str, html: str) -> None:
+    p = _cache_path(url)
     try:
-        response = requests.get(
-            url,
-            timeout=20,
-            headers={"User-Agent": "Mozilla/5.0"},
-        )
-        response.raise_for_status()
-
-        return {
-            "status": "success",
-            "url": url,
-            "html": response.text,
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error_message": str(e),
-        }
+        p.parent.mkdir(parents=True, exist_ok=True)
+        tmp = p.with_suffix(".tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8", compresslevel=1) as f:
+            f.write(html)
+        os.replace(tmp, p)
+    except OSError:
+        # The cache is best-effort; a failed write must not fail the fetch.
+        pass
+
+
+def _extract_main_content(html: str) -> str:
+    # Strip nav/ads/boilerplate so the model only sees the posting itself.
+    text = trafilatura.extract(html, include_comments=False, include_tables=False)
+    return text or html
 
 
 class WebToolset(BaseToolset):
     def __init__(self, tool_name_prefix: str = "web_"):
         super().__init__(tool_name_prefix=tool_name_prefix)
 
+        # One pooled client per toolset so repeated fetches reuse TCP/TLS connections.
+        # It lives as long as the process: the toolset is shared by every run.
+        self._client: Optional[httpx.AsyncClient] = None
         self._tools: List[BaseTool] = [
-            FunctionTool(func=web_fetch_html),
+            FunctionTool(func=self.web_fetch_html),
         ]
 
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                headers={"User-Agent": "Mozilla/5.0"},
+            )
+        return self._client
+
+    async def web_fetch_html(self, url: str) -> Dict[str, Any]:
+        """
+        Fetch a webpage and return its main content with boilerplate
+        (navigation, ads, footers) stripped. Falls back to the raw HTML when
+        no main content can be extracted.
+        """
+        try:
+            html = await asyncio.to_thread(_cache_get, url)
+            cached = html is not None
+            if not cached:
+                response = await self._get_client().get(url, timeout=20)
+                response.raise_for_status()
+                html = response.text
+                await asyncio.to_thread(_cache_put, url, html)
+
+            text = await asyncio.to_thread(_extract_main_content, html)
+            result = {
+                "status": "success",
+                "url": url,
+                "html": text,
+                "extracted": text != html,
+            }
+            if cached:
+                result["cached"] = True
+            return result
+        except Exception as e:
+            return {
+                "status": "error",
+                "error_message": str(e),
+            }
+
     async def get_tools(
         self, readonly_context: Optional[ReadonlyContext] = None
     ) -> List[BaseTool]:
         return self._tools
 
     async def close(self) -> None:
+        # AgentTool closes sub-agent toolsets after every run, while concurrent
+        # runs may still be fetching; keep the shared pool open.
         await asyncio.sleep(0)
@@ -4,16 +4,24 @@ import asyncio
 import csv
 import difflib
 import hashlib
+import os
 import re
+import shutil
+import stat
+import subprocess
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import ahocorasick
 from google.adk.agents.readonly_context import ReadonlyContext
 from google.adk.tools.base_tool import BaseTool
 from google.adk.tools.base_toolset import BaseToolset
 from google.adk.tools.function_tool import FunctionTool
 from google.adk.tools.tool_context import ToolContext
 
+from . import json_fast
+
 # ---------------------------
 # Helpers
 # ---------------------------
@@ -21,15 +29,106 @@ from google.adk.tools.tool_context import ToolContext
 
 def _resolve(path: str) -> Path:
     # Keep it simple: resolve relative to current working dir.
+    # Absolute paths are used as-is to skip the expanduser/realpath syscalls.
+    if os.path.isabs(path):
+        return Path(path)
     return Path(path).expanduser().resolve()
 
 
+_WS_RE = re.compile(r"\s+")
+_NONSLUG_RE = re.compile(r"[^a-z0-9_]+")
+_DUP_UNDERSCORE_RE = re.compile(r"_+")
+
+
 def _sanitize_slug(s: str, max_len: int = 80) -> str:
     s = s.lower().strip()
-    s = re.sub(r"\s+", "_", s)
-    s = re.sub(r"[^a-z0-9_]+", "", s)
-    s = re.sub(r"_+", "_", s).strip("_")
-    return s[:max_len] if len(s) > max_len else s
+    s = _WS_RE.sub("_", s)
+    s = _NONSLUG_RE.sub("", s)
+    s = _DUP_UNDERSCORE_RE.sub("_", s).strip("_")
+    return s[:max_len]
+
+
+def _normalize_match_text(s: str) -> str:
+    return _WS_RE.sub(" ", s.lower()).strip()
+
+
+def _git_unified_diff(
+    from_text: str, to_text: str, from_name: str, to_name: str, context_lines: int
+) -> Optional[Dict[str, Any]]:
+    """Diff via `git diff --no-index` (C Myers diff); None if git can't be used."""
+    git = shutil.which("git")
+    if git is None:
+        return None
+    with tempfile.TemporaryDirectory() as tmp:
+        a = Path(tmp) / "a"
+        b = Path(tmp) / "b"
+        a.write_bytes(from_text.encode("utf-8"))
+        b.write_bytes(to_text.encode("utf-8"))
+        proc = subprocess.run(
+            [
+                git,
+                "diff",
+                "--no-index",
+                "--no-color",
+                "--no-ext-diff",
+                "--no-prefix",
+                "--numstat",
+                "-p",
+                f"-U{context_lines}",
+                str(a),
+                str(b),
+            ],
+            capture_output=True,
+            cwd=tmp,
+        )
+    # Exit code 0 = identical, 1 = differences, anything else is a failure.
+    if proc.returncode not in (0, 1):
+        return None
+    if proc.returncode == 0:
+        return {"status": "success", "diff": "", "approx_changed_lines": 0}
+
+    # Decode by hand: text=True would translate \r\n to \n, unlike difflib.
+    lines = proc.stdout.decode("utf-8").splitlines(keepends=True)
+    added, deleted = lines[0].split("\t")[:2]
+    if not (added.isdigit() and deleted.isdigit()):
+        # Binary-looking input; let difflib handle it.
+        return None
+
+    # Drop git's own headers and relabel the file names like difflib does.
+    start = next((i for i, line in enumerate(lines) if line.startswith("--- ")), None)
+    if start is None:
+        return None
+    body = lines[start + 2 :]
+    diff = f"--- {from_name}\n+++ {to_name}\n" + "".join(body)
+    return {
+        "status": "success",
+        "diff": diff,
+        "approx_changed_lines": int(added) + int(deleted),
+    }
+
+
+# Decoded file contents for fs_read_text: path -> (mtime_ns, size, text).
+_READ_CACHE: Dict[str, Tuple[int, int, str]] = {}
+_READ_CACHE_MAX = 32
+
+
+def _cached_read(p: Path, st: os.stat_result) -> str:
+    """Return p's text, re-reading only if mtime or size changed since last read."""
+    key = str(p)
+    entry = _READ_CACHE.get(key)
+    if entry is not None and entry[:2] == (st.st_mtime_ns, st.st_size):
+        return entry[2]
+
+    fd = os.open(key, os.O_RDONLY)
+    try:
+        data = os.read(fd, st.st_size)
+    finally:
+        os.close(fd)
+    text = data.decode("utf-8")
+    if len(_READ_CACHE) >= _READ_CACHE_MAX:
+        _READ_CACHE.clear()
+    _READ_CACHE[key] = (st.st_mtime_ns, st.st_size, text)
+    return text
 
 
 # ---------------------------
@@ -51,15 +150,19 @@ def fs_read_text(path: str, max_bytes: int = 2_000_000) -> Dict[str, Any]:
     """
     try:
         p = _resolve(path)
-        if not p.exists() or not p.is_file():
+        try:
+            st = os.stat(p)
+        except FileNotFoundError:
+            return {"status": "error", "error_message": f"File not found: {p}"}
+        if not stat.S_ISREG(st.st_mode):
             return {"status": "error", "error_message": f"File not found: {p}"}
-        data = p.read_bytes()
-        if len(data) > max_bytes:
+        # Reject oversize files from the stat result, before reading anything.
+        if st.st_size > max_bytes:
             return {
                 "status": "error",
-                "error_message": f"File too large: {len(data)} > {max_bytes}",
+                "error_message": f"File too large: {st.st_size} > {max_bytes}",
             }
-        return {"status": "success", "path": str(p), "content": data.decode("utf-8")}
+        return {"status": "success", "path": str(p), "content": _cached_read(p, st)}
     except Exception as e:
         return {"status": "error", "error_message": str(e)}
 
@@ -86,6 +189,7 @@ def fs_write_text(path: str, content: str, overwrite: bool = False) -> Dict[str,
         p.parent.mkdir(parents=True, exist_ok=True)
         b = content.encode("utf-8")
         p.write_bytes(b)
+        _READ_CACHE.pop(str(p), None)
         return {"status": "success", "path": str(p), "bytes": len(b)}
     except Exception as e:
         return {"status": "error", "error_message": str(e)}
@@ -110,6 +214,46 @@ def fs_mkdir(path: str) -> Dict[str, Any]:
         return {"status": "error", "error_message": str(e)}
 
 
+def fs_save_artifact(
+    folder: str, filename: str, content: str, overwrite: bool = False
+) -> Dict[str, Any]:
+    """
+    Create a folder, write a UTF-8 file into it atomically and hash it, in one call.
+
+    Args:
+        folder: Output directory (created with parents if missing).
+        filename: File name inside folder.
+        content: Text to write.
+        overwrite: If False and file exists, return error.
+    Returns:
+        {'status': 'success', 'path': '<resolved>', 'sha256': '<hex>', 'bytes': N}
+        or {'status': 'error', 'error_message': '...'}
+    """
+    try:
+        d = _resolve(folder)
+        d.mkdir(parents=True, exist_ok=True)
+        p = d / filename
+        if p.exists() and not overwrite:
+            return {
+                "status": "error",
+                "error_message": f"File exists and overwrite=false: {p}",
+            }
+        b = content.encode("utf-8")
+        # Write to a sibling temp file and rename so readers never see a partial file.
+        tmp = p.with_suffix(p.suffix + ".tmp")
+        tmp.write_bytes(b)
+        os.replace(tmp, p)
+        _READ_CACHE.pop(str(p), None)
+        return {
+            "status": "success",
+            "path": str(p),
+            "sha256": hashlib.sha256(b).hexdigest(),
+            "bytes": len(b),
+        }
+    except Exception as e:
+        return {"status": "error", "error_message": str(e)}
+
+
 def fs_sha256(path: str) -> Dict[str, Any]:
     """
     Compute SHA-256 of a file.
@@ -124,10 +268,8 @@ def fs_sha256(path: str) -> Dict[str, Any]:
         p = _resolve(path)
         if not p.exists() or not p.is_file():
             return {"status": "error", "error_message": f"File not found: {p}"}
-        h = hashlib.sha256()
         with p.open("rb") as f:
-            for chunk in iter(lambda: f.read(1024 * 1024), b""):
-                h.update(chunk)
+            h = hashlib.file_digest(f, "sha256")
         return {"status": "success", "path": str(p), "sha256": h.hexdigest()}
     except Exception as e:
         return {"status": "error", "error_message": str(e)}
@@ -148,6 +290,12 @@ def text_unified_diff(
         or {'status': 'error', 'error_message': '...'}
     """
     try:
+        result = _git_unified_diff(
+            from_text, to_text, from_name, to_name, context_lines
+        )
+        if result is not None:
+            return result
+
         a = from_text.splitlines(keepends=True)
         b = to_text.splitlines(keepends=True)
         diff_lines = list(
@@ -167,6 +315,117 @@ def text_unified_diff(
         return {"status": "error", "error_message": str(e)}
 
 
+def fs_keyword_coverage(text: str, keywords: List[str]) -> Dict[str, Any]:
+    """
+    Compute how many keywords occur in a text (case-insensitive substring match).
+
+    All keywords are matched in a single Aho-Corasick pass over the text.
+
+    Args:
+        text: Text to search (e.g. resume content).
+        keywords: Keywords or phrases to look for.
+    Returns:
+        {'status': 'success', 'matched': [...], 'missing': [...], 'coverage': 0-100}
+        or {'status': 'error', 'error_message': '...'}
+    """
+    try:
+        wanted: Dict[str, str] = {}
+        for kw in keywords:
+            norm = _normalize_match_text(kw)
+            if norm:
+                wanted.setdefault(norm, kw)
+        if not wanted:
+            return {"status": "success", "matched": [], "missing": [], "coverage": 0.0}
+
+        automaton = ahocorasick.Automaton()
+        for norm in wanted:
+            automaton.add_word(norm, norm)
+        automaton.make_automaton()
+        found = {norm for _, norm in automaton.iter(_normalize_match_text(text))}
+
+        matched = [kw for norm, kw in wanted.items() if norm in found]
+        missing = [kw for norm, kw in wanted.items() if norm not in found]
+        return {
+            "status": "success",
+            "matched": matched,
+            "missing": missing,
+            "coverage": round(len(matched) / len(wanted) * 100, 2),
+        }
+    except Exception as e:
+        return {"status": "error", "error_message": str(e)}
+
+
+def fs_score_application(
+    job_intel_json: str,
+    resume_base_path: str,
+    resume_tailored_path: str,
+    job_folder_path: str = "",
+) -> Dict[str, Any]:
+    """
+    Compute the full application metrics and save them as metrics.json.
+
+    Combines the SHA-256 hashes, fs_keyword_coverage and text_unified_diff so
+    the scorer needs a single tool call.
+
+    Args:
+        job_intel_json: Job Intel output (JSON text).
+        resume_base_path: Base resume path.
+        resume_tailored_path: Tailored resume path.
+        job_folder_path: Folder for metrics.json; defaults to the tailored resume's folder.
+    Returns:
+        {'status': 'success', 'metrics': {job_id, resume_base_hash, resume_tailored_hash,
+         keyword_coverage, must_have_coverage, diff_size, metrics_path}}
+        or {'status': 'error', 'error_message': '...'}
+    """
+    try:
+        intel = json_fast.loads(job_intel_json)
+        base = fs_read_text(resume_base_path)
+        tailored = fs_read_text(resume_tailored_path)
+        for res in (base, tailored):
+            if res["status"] != "success":
+                return res
+
+        # Hash the text already read so hashes match the content that was scored.
+        base_hash = hashlib.sha256(base["content"].encode("utf-8")).hexdigest()
+        tailored_hash = hashlib.sha256(tailored["content"].encode("utf-8")).hexdigest()
+        keywords = fs_keyword_coverage(
+            tailored["content"], intel.get("keywords_for_ats") or []
+        )
+        must_have = [
+            m.get("item", "") if isinstance(m, dict) else str(m)
+            for m in (intel.get("requirements") or {}).get("must_have") or []
+        ]
+        must_have_cov = fs_keyword_coverage(tailored["content"], must_have)
+        diff = text_unified_diff(base["content"], tailored["content"])
+        for res in (keywords, must_have_cov, diff):
+            if res["status"] != "success":
+                return res
+
+        folder = (
+            _resolve(job_folder_path)
+            if job_folder_path
+            else _resolve(resume_tailored_path).parent
+        )
+        metrics_path = folder / "metrics.json"
+        metrics = {
+            "job_id": intel.get("job_id", ""),
+            "resume_base_hash": base_hash,
+            "resume_tailored_hash": tailored_hash,
+            "keyword_coverage": keywords["coverage"],
+            "must_have_coverage": must_have_cov["coverage"],
+            "diff_size": diff["approx_changed_lines"],
+            "metrics_path": str(metrics_path),
+        }
+        written = fs_write_text(
+            str(metrics_path), json_fast.dumps(metrics), overwrite=True
+        )
+        if written["status"] != "success":
+            return written
+        return {"status": "success", "metrics": metrics}
+    except Exception as e:
+        return {"status": "error", "error_message": str(e)}
+
+
 def csv_append_row(
     csv_path: str, header: List[str], row: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -183,14 +442,13 @@ def csv_append_row(
     """
     try:
         p = _resolve(csv_path)
-        created = not p.exists()
-        p.parent.mkdir(parents=True, exist_ok=True)
-
         out_row = {k: row.get(k, "") for k in header}
 
-        mode = "a" if p.exists() else "w"
-        with p.open(mode, newline="", encoding="utf-8") as f:
+        p.parent.mkdir(parents=True, exist_ok=True)
+        with p.open("a", newline="", encoding="utf-8") as f:
             writer = csv.DictWriter(f, fieldnames=header, extrasaction="ignore")
+            # Append mode starts at end-of-file, so position 0 means a new/empty file.
+            created = f.tell() == 0
             if created:
                 writer.writeheader()
             writer.writerow(out_row)
@@ -239,8 +497,11 @@ class JobHuntToolset(BaseToolset):
             FunctionTool(func=fs_read_text),
             FunctionTool(func=fs_write_text),
             FunctionTool(func=fs_mkdir),
+            FunctionTool(func=fs_save_artifact),
             FunctionTool(func=fs_sha256),
             FunctionTool(func=text_unified_diff),
+            FunctionTool(func=fs_keyword_coverage),
+            FunctionTool(func=fs_score_application),
             FunctionTool(func=csv_append_row),
             FunctionTool(func=util_make_job_folder_name),
         ]
@@ -253,3 +514,14 @@ class JobHuntToolset(BaseToolset):
 
     async def close(self) -> None:
         await asyncio.sleep(0)
+
+
+# Shared instance so every agent uses the same tools and in-process caches.
+JOBHUNT_TOOLSET: JobHuntToolset | None = None
+
+
+def get_toolset() -> JobHuntToolset:
+    global JOBHUNT_TOOLSET
+    if JOBHUNT_TOOLSET is None:
+        JOBHUNT_TOOLSET = JobHuntToolset()
+    return JOBHUNT_TOOLSET
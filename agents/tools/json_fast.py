@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Both paths emit compact, key-sorted output so results are stable enough to hash.
+
+
+def dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(s: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
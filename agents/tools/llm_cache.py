@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import AsyncGenerator, List, Optional
+
+import zstandard
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+
+from . import json_fast
+from .llm_pool import PooledLiteLlm
+
+# ---------------------------
+# SQLite store
+# ---------------------------
+
+_LLM_CACHE_SETTING = os.environ.get(
+    "JOBHUNT_LLM_CACHE", "~/.cache/jobhunt/llm_cache.sqlite"
+)
+# JOBHUNT_LLM_CACHE=off bypasses the cache; any other value is the file path.
+_LLM_CACHE_ENABLED = _LLM_CACHE_SETTING.lower() != "off"
+_LLM_CACHE_PATH = Path(_LLM_CACHE_SETTING).expanduser()
+_LLM_CACHE_TTL_SECONDS = int(os.environ.get("JOBHUNT_LLM_CACHE_TTL", str(24 * 60 * 60)))
+
+# Bump when the table layout changes; older tables are dropped on connect.
+_SCHEMA_VERSION = 2
+
+_conn: Optional[sqlite3.Connection] = None
+_lock = threading.Lock()
+_compressor = zstandard.ZstdCompressor(level=3)
+_decompressor = zstandard.ZstdDecompressor()
+
+
+def _connect() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        _LLM_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            str(_LLM_CACHE_PATH), check_same_thread=False, isolation_level=None
+        )
+        # WAL lets several agent processes read while one writes; mmap serves
+        # lookups straight from the page cache.
+        conn.executescript(
+            "PRAGMA journal_mode=WAL;"
+            "PRAGMA synchronous=NORMAL;"
+            "PRAGMA mmap_size=268435456;"
+        )
+        if conn.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS cache")
+            conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache("
+            "h BLOB PRIMARY KEY, model TEXT, resp BLOB, ts INTEGER)"
+        )
+        _conn = conn
+    return _conn
+
+
+def _cache_get(key: bytes) -> Optional[List[LlmResponse]]:
+    with _lock:
+        row = (
+            _connect()
+            .execute("SELECT resp, ts FROM cache WHERE h = ?", (key,))
+            .fetchone()
+        )
+    if row is None or time.time() - row[1] > _LLM_CACHE_TTL_SECONDS:
+        return None
+    payload = json_fast.loads(_decompressor.decompress(row[0]))
+    return [LlmResponse.model_validate(r) for r in payload]
+
+
+def _cache_put(key: bytes, model: str, responses: List[LlmResponse]) -> None:
+    payload = json_fast.dumps(
+        [r.model_dump(mode="json", exclude_none=True) for r in responses]
+    )
+    resp = _compressor.compress(payload.encode("utf-8"))
+    with _lock:
+        _connect().execute(
+            "INSERT OR REPLACE INTO cache(h, model, resp, ts) VALUES (?, ?, ?, ?)",
+            (key, model, resp, int(time.time())),
+        )
+
+
+def prompt_cache_key(instruction: str) -> str:
+    """Stable provider prompt-cache key for an agent's static instruction."""
+    return hashlib.sha1(instruction.encode("utf-8")).hexdigest()
+
+
+# ---------------------------
+# Model wrapper
+# ---------------------------
+
+
+class CachedLiteLlm(PooledLiteLlm):
+    """
+    PooledLiteLlm with exact-match response caching. Cache hits never touch
+    the connection pool or the concurrency limit.
+
+    The key covers the model name and the full serialized request (system
+    instruction, tool declarations and conversation contents), so any change
+    in inputs or tool outputs is a miss. Entries expire after
+    JOBHUNT_LLM_CACHE_TTL seconds (default 24h). Streamed partial chunks are
+    passed through but not stored; a hit replays only the final responses.
+    """
+
+    def _cache_key(self, llm_request: LlmRequest) -> bytes:
+        request = llm_request.model_dump(mode="json", exclude_none=True)
+        blob = json_fast.dumps([self.model, request])
+        return hashlib.blake2b(blob.encode("utf-8"), digest_size=16).digest()
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        key, cached = None, None
+        if _LLM_CACHE_ENABLED:
+            try:
+                key = self._cache_key(llm_request)
+                # SQLite, zstd and JSON work stays off the event loop.
+                cached = await asyncio.to_thread(_cache_get, key)
+            except Exception:
+                # Never let the cache break a model call.
+                key, cached = None, None
+
+        if cached is not None:
+            for response in cached:
+                yield response
+            return
+
+        final: List[LlmResponse] = []
+        async for response in super().generate_content_async(
+            llm_request, stream=stream
+        ):
+            if not response.partial:
+                final.append(response)
+            yield response
+
+        if key is not None and final and not any(r.error_code for r in final):
+            try:
+                await asyncio.to_thread(_cache_put, key, self.model, final)
+            except Exception:
+                pass
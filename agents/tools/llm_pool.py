@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Any, AsyncGenerator, List, Optional
+
+import httpx
+import litellm
+from google.adk.models.lite_llm import LiteLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+
+# ---------------------------
+# Shared connection pool
+# ---------------------------
+
+_LLM_CONCURRENCY = int(os.environ.get("JOBHUNT_LLM_CONCURRENCY", "20"))
+
+# Caps in-flight model calls across every agent in the process.
+_semaphore = asyncio.Semaphore(_LLM_CONCURRENCY)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def shared_http_client() -> httpx.AsyncClient:
+    """Process-wide HTTP/2 client used by litellm for all provider calls."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64),
+            # Generations can be slow; only the connect phase gets a short timeout.
+            timeout=httpx.Timeout(600.0, connect=10.0),
+        )
+    return _http_client
+
+
+# ---------------------------
+# Model wrapper
+# ---------------------------
+
+
+class PooledLiteLlm(LiteLlm):
+    """
+    LiteLlm that sends every request over one shared, multiplexed HTTP client
+    and gates concurrent provider calls with a process-wide semaphore
+    (JOBHUNT_LLM_CONCURRENCY, default 20). Partial chunks stream through;
+    final responses are yielded after the slot is released.
+    """
+
+    def __init__(self, model: str, **kwargs: Any):
+        super().__init__(model=model, **kwargs)
+        # litellm's OpenAI-compatible handlers pick this session up for every call.
+        if litellm.aclient_session is None:
+            litellm.aclient_session = shared_http_client()
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        # Partial chunks stream out while the slot is held. ADK only runs tools
+        # (including AgentTool sub-agents, which need slots of their own) after
+        # a final response, so those are buffered and yielded once the slot is
+        # released; holding it across that yield can deadlock.
+        final: List[LlmResponse] = []
+        async with _semaphore:
+            async for response in super().generate_content_async(
+                llm_request, stream=stream
+            ):
+                if response.partial:
+                    yield response
+                else:
+                    final.append(response)
+        for response in final:
+            yield response